@@ -1,8 +1,30 @@
+import inspect
 from typing import Type, Optional, Coroutine
 from pydantic import BaseModel
 from cognee.infrastructure.llm import get_llm_config
 
 
+def _accepts_history(method) -> bool:
+    """Check whether an adapter method declares an explicit ``history`` parameter."""
+    try:
+        return "history" in inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _fold_history_into_input(text_input: str, history: list) -> str:
+    """
+    Concatenate prior conversation turns in front of the user input.
+
+    Fallback for adapters without native history support: most adapters pass
+    unknown kwargs straight to their SDK client, where an unexpected
+    ``history`` field is either rejected by the provider or silently dropped,
+    so the turns are folded into the prompt text instead.
+    """
+    history_text = "\n".join(str(entry.get("content", "")) for entry in history)
+    return f"{history_text}\n{text_input}"
+
+
 class LLMGateway:
     """
     Class handles selection of structured output frameworks and LLM functions.
@@ -13,12 +35,17 @@ class LLMGateway:
     def acreate_structured_output(
         text_input: str, system_prompt: str, response_model: Type[BaseModel], **kwargs
     ) -> Coroutine:
+        history = kwargs.pop("history", None)
+
         llm_config = get_llm_config()
         if llm_config.structured_output_framework.upper() == "BAML":
             from cognee.infrastructure.llm.structured_output_framework.baml.baml_src.extraction import (
                 acreate_structured_output,
             )
 
+            if history:
+                text_input = _fold_history_into_input(text_input, history)
+
             return acreate_structured_output(
                 text_input=text_input,
                 system_prompt=system_prompt,
@@ -30,6 +57,15 @@ class LLMGateway:
             )
 
             llm_client = get_llm_client()
+            # Only adapters that declare history get it as a kwarg; the rest
+            # would forward it into their SDK request body, so fold it into
+            # the prompt text for them instead.
+            if history:
+                if _accepts_history(llm_client.acreate_structured_output):
+                    kwargs["history"] = history
+                else:
+                    text_input = _fold_history_into_input(text_input, history)
+
             return llm_client.acreate_structured_output(
                 text_input=text_input,
                 system_prompt=system_prompt,
@@ -37,6 +73,49 @@ class LLMGateway:
                 **kwargs,
             )
 
+    @staticmethod
+    def acreate_text_completion(text_input: str, system_prompt: str, **kwargs) -> Coroutine:
+        """
+        Plain-text completion fast path for response_model=str callers.
+
+        Bypasses the structured-output machinery (JSON schema injection into the
+        prompt, pydantic validation, validation retries) when the caller only
+        wants free text back. Falls back to the structured-output path for
+        frameworks/clients that have no plain completion support.
+        """
+        history = kwargs.pop("history", None)
+
+        llm_config = get_llm_config()
+        if llm_config.structured_output_framework.upper() == "BAML":
+            if history:
+                kwargs["history"] = history
+            return LLMGateway.acreate_structured_output(
+                text_input=text_input, system_prompt=system_prompt, response_model=str, **kwargs
+            )
+
+        from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.get_llm_client import (
+            get_llm_client,
+        )
+
+        llm_client = get_llm_client()
+        if hasattr(llm_client, "acreate_text_completion"):
+            if history:
+                if _accepts_history(llm_client.acreate_text_completion):
+                    kwargs["history"] = history
+                else:
+                    text_input = _fold_history_into_input(text_input, history)
+            return llm_client.acreate_text_completion(
+                text_input=text_input, system_prompt=system_prompt, **kwargs
+            )
+        if history:
+            if _accepts_history(llm_client.acreate_structured_output):
+                kwargs["history"] = history
+            else:
+                text_input = _fold_history_into_input(text_input, history)
+        return llm_client.acreate_structured_output(
+            text_input=text_input, system_prompt=system_prompt, response_model=str, **kwargs
+        )
+
     @staticmethod
     def create_transcript(input) -> Coroutine:
         from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.get_llm_client import (
@@ -2,6 +2,10 @@ from os import path
 from cognee.shared.logging_utils import get_logger, ERROR
 from cognee.root_dir import get_absolute_path
 
+# Prompt files rarely change but are read once per LLM call; cache contents
+# keyed by modification time so edits are still picked up without a restart.
+_prompt_cache: dict = {}
+
 
 def read_query_prompt(prompt_file_name: str, base_directory: str = None):
     """
@@ -33,8 +37,16 @@ def read_query_prompt(prompt_file_name: str, base_directory: str = None):
 
         file_path = path.join(base_directory, prompt_file_name)
 
+        modified_at = path.getmtime(file_path)
+        cached_entry = _prompt_cache.get(file_path)
+        if cached_entry is not None and cached_entry[0] == modified_at:
+            return cached_entry[1]
+
         with open(file_path, "r", encoding="utf-8") as file:
-            return file.read()
+            prompt = file.read()
+
+        _prompt_cache[file_path] = (modified_at, prompt)
+        return prompt
     except FileNotFoundError:
         logger.error(f"Error: Prompt file not found. Attempted to read: {file_path}")
         return None
@@ -1,6 +1,22 @@
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from cognee.root_dir import get_absolute_path
 
+# One Jinja2 environment per template directory. The environment caches
+# compiled templates internally and, with auto_reload on (the default),
+# recompiles only when a template file's modification time changes — so
+# render_prompt avoids re-reading and re-parsing the template per LLM call.
+_environment_cache: dict = {}
+
+
+def _get_template_environment(base_directory: str) -> Environment:
+    """Return the cached Jinja2 environment for a template directory."""
+    if base_directory not in _environment_cache:
+        _environment_cache[base_directory] = Environment(
+            loader=FileSystemLoader(base_directory),
+            autoescape=select_autoescape(["html", "xml", "txt"]),
+        )
+    return _environment_cache[base_directory]
+
 
 def render_prompt(filename: str, context: dict, base_directory: str = None) -> str:
     """
@@ -27,11 +43,8 @@ def render_prompt(filename: str, context: dict, base_directory: str = None) -> s
     if base_directory is None:
         base_directory = get_absolute_path("./infrastructure/llm/prompts")
 
-    # Initialize the Jinja2 environment to load templates from the filesystem
-    env = Environment(
-        loader=FileSystemLoader(base_directory),
-        autoescape=select_autoescape(["html", "xml", "txt"]),
-    )
+    # Reuse the cached Jinja2 environment for this template directory
+    env = _get_template_environment(base_directory)
 
     # Load the template by name
     template = env.get_template(filename)
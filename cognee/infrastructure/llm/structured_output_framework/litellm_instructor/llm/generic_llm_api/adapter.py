@@ -218,7 +218,7 @@ class GenericAPIAdapter(LLMInterface):
             The generated transcription of the audio file.
         """
         async with open_data_file(input, mode="rb") as audio_file:
-            encoded_string = base64.b64encode(audio_file.read()).decode("utf-8")
+            encoded_string = base64.b64encode(audio_file.read()).decode("ascii")
         mime_type, _ = mimetypes.guess_type(input)
         if not mime_type or not mime_type.startswith("audio/"):
             raise ValueError(
@@ -271,7 +271,7 @@ class GenericAPIAdapter(LLMInterface):
             - The completion response containing the image description.
         """
         async with open_data_file(input, mode="rb") as image_file:
-            encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
+            encoded_image = base64.b64encode(image_file.read()).decode("ascii")
         mime_type, _ = mimetypes.guess_type(input)
         if not mime_type or not mime_type.startswith("image/"):
             mime_type = "image/jpeg"
@@ -1,10 +1,13 @@
-import base64
+import os
+import asyncio
+import httpx
 import litellm
 import logging
 import instructor
-from typing import Type
-from openai import OpenAI
-from pydantic import BaseModel
+from typing import List, Type
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ValidationError
+from instructor.core import InstructorRetryException
 
 from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.llm_interface import (
     LLMInterface,
@@ -16,12 +19,99 @@ from tenacity import (
     retry,
     stop_after_delay,
     wait_exponential_jitter,
+    retry_if_exception,
     retry_if_not_exception_type,
     before_sleep_log,
 )
 
+try:
+    # Drop-in stdlib replacement with SIMD-accelerated (AVX2/SSSE3) encoding,
+    # typically several times faster on multi-MB images.
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 logger = get_logger()
 
+# Errors that will never succeed on retry — malformed requests, auth failures,
+# oversized prompts and schema-validation failures. Failing fast on these
+# keeps p99 latency down and saves rate-limit quota for requests that can
+# actually complete, instead of burning the full backoff window.
+_NON_RETRYABLE_EXCEPTIONS = (
+    litellm.exceptions.NotFoundError,
+    litellm.exceptions.BadRequestError,
+    litellm.exceptions.AuthenticationError,
+    litellm.exceptions.ContextWindowExceededError,
+    ValidationError,
+    InstructorRetryException,
+)
+
+
+def _is_retryable_transcription_error(exception: BaseException) -> bool:
+    """
+    Retry predicate for the httpx-based transcription call.
+
+    Applies the same fail-fast policy as _NON_RETRYABLE_EXCEPTIONS to httpx
+    status errors: a 4xx (bad request, auth failure, oversized upload) will
+    never succeed on retry, while 5xx responses and transport-level failures
+    (timeouts, dropped connections) are worth the backoff window.
+    """
+    if isinstance(exception, _NON_RETRYABLE_EXCEPTIONS):
+        return False
+    if isinstance(exception, httpx.HTTPStatusError):
+        return exception.response.status_code >= 500
+    if isinstance(exception, ValueError):
+        # A 2xx response without a transcript is a contract failure, not transient.
+        return False
+    return True
+
+
+# 64 KB read size rounded to a multiple of 3 bytes, so each chunk encodes to
+# base64 without padding and the per-chunk outputs can simply be concatenated.
+_B64_CHUNK_SIZE = 65536 * 3
+
+
+# Instructor clients are pooled per (event loop, endpoint, api_key, mode) so
+# the underlying HTTP connection pool — and its keep-alive TCP/TLS connections
+# — survives adapter recreation instead of paying a fresh handshake per
+# instance. The loop is part of the key because httpx connections are bound to
+# the loop they were opened on: reusing them after that loop is closed (e.g.
+# back-to-back asyncio.run() calls) fails with "Event loop is closed".
+_client_cache: dict = {}
+
+
+def _get_instructor_client(endpoint: str, api_key: str, instructor_mode: str):
+    """Return an instructor client shared within the current event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    for stale_key in [key for key in _client_cache if key[0] is not None and key[0].is_closed()]:
+        del _client_cache[stale_key]
+
+    cache_key = (loop, endpoint, api_key, instructor_mode)
+    if cache_key not in _client_cache:
+        _client_cache[cache_key] = instructor.from_openai(
+            AsyncOpenAI(base_url=endpoint, api_key=api_key),
+            mode=instructor.Mode(instructor_mode),
+        )
+    return _client_cache[cache_key]
+
+
+def _encode_b64_chunked(file) -> str:
+    """
+    Base64-encode a file in fixed-size chunks into a preallocated buffer.
+
+    Intended to run off the event loop (via asyncio.to_thread): chunked reads
+    avoid holding both the raw bytes and the encoded copy of a multi-MB file
+    in memory at once.
+    """
+    encoded = bytearray()
+    while chunk := file.read(_B64_CHUNK_SIZE):
+        encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
+
 
 class OllamaAPIAdapter(LLMInterface):
     """
@@ -30,6 +120,8 @@ class OllamaAPIAdapter(LLMInterface):
     Public methods:
 
     - acreate_structured_output
+    - acreate_structured_outputs_batched
+    - acreate_text_completion
     - create_transcript
     - transcribe_image
 
@@ -68,20 +160,31 @@ class OllamaAPIAdapter(LLMInterface):
 
         self.instructor_mode = instructor_mode if instructor_mode else self.default_instructor_mode
 
-        self.aclient = instructor.from_openai(
-            OpenAI(base_url=self.endpoint, api_key=self.api_key),
-            mode=instructor.Mode(self.instructor_mode),
-        )
+    @property
+    def aclient(self):
+        """
+        The pooled instructor client for the current event loop.
+
+        Resolved per access rather than pinned in __init__, since adapter
+        instances are long-lived and may be used from more than one
+        asyncio.run() loop over their lifetime.
+        """
+        return _get_instructor_client(self.endpoint, self.api_key, self.instructor_mode)
 
     @retry(
         stop=stop_after_delay(128),
         wait=wait_exponential_jitter(8, 128),
-        retry=retry_if_not_exception_type(litellm.exceptions.NotFoundError),
+        retry=retry_if_not_exception_type(_NON_RETRYABLE_EXCEPTIONS),
         before_sleep=before_sleep_log(logger, logging.DEBUG),
         reraise=True,
     )
     async def acreate_structured_output(
-        self, text_input: str, system_prompt: str, response_model: Type[BaseModel], **kwargs
+        self,
+        text_input: str,
+        system_prompt: str,
+        response_model: Type[BaseModel],
+        history: list = None,
+        **kwargs,
     ) -> BaseModel:
         """
         Generate a structured output from the LLM using the provided text and system prompt.
@@ -96,6 +199,9 @@ class OllamaAPIAdapter(LLMInterface):
             - system_prompt (str): The system prompt that guides the response generation.
             - response_model (Type[BaseModel]): The model type that the response should conform
               to.
+            - history (list): Optional prior conversation turns as {'role', 'content'} dicts,
+              emitted as separate messages between the system prompt and the user input.
+              (default None)
 
         Returns:
         --------
@@ -103,28 +209,190 @@ class OllamaAPIAdapter(LLMInterface):
             - BaseModel: A structured output that conforms to the specified response model.
         """
         async with llm_rate_limiter_context_manager():
-            response = self.aclient.chat.completions.create(
+            response = await self.aclient.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"{text_input}",
-                    },
-                    {
-                        "role": "system",
-                        "content": system_prompt,
-                    },
-                ],
+                messages=self._build_messages(text_input, system_prompt, history),
                 max_retries=2,
                 response_model=response_model,
             )
 
         return response
 
+    def _build_messages(self, text_input: str, system_prompt: str, history: list = None) -> list:
+        """
+        Build the chat message list as [system, *history, user].
+
+        The system prompt and history go before the variable user input so
+        providers with prefix-based prompt caching (Anthropic/OpenAI) can reuse
+        the KV state of the stable prefix; for Anthropic-backed models the
+        prefix additionally carries ephemeral cache_control markers. Keeping
+        history as separate messages — instead of concatenating it into the
+        system prompt — means only the newly appended turn is uncached.
+        """
+        is_anthropic = self.model.startswith("claude") or "anthropic" in self.model
+
+        if is_anthropic:
+            system_content = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        else:
+            system_content = system_prompt
+
+        messages = [
+            {
+                "role": "system",
+                "content": system_content,
+            }
+        ]
+
+        if history:
+            history = [dict(entry) for entry in history]
+            if is_anthropic:
+                # A single cache breakpoint on the last history entry caches the
+                # whole prefix (system + history) up to that point; Anthropic
+                # allows at most four breakpoints per request.
+                last_entry = history[-1]
+                last_entry["content"] = [
+                    {
+                        "type": "text",
+                        "text": last_entry["content"],
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            messages.extend(history)
+
+        messages.append(
+            {
+                "role": "user",
+                # No f-string copy: the input is already a str in the common case,
+                # and duplicating a large context here doubles its peak memory.
+                "content": text_input if isinstance(text_input, str) else str(text_input),
+            }
+        )
+
+        return messages
+
+    @retry(
+        stop=stop_after_delay(128),
+        wait=wait_exponential_jitter(8, 128),
+        retry=retry_if_not_exception_type(_NON_RETRYABLE_EXCEPTIONS),
+        before_sleep=before_sleep_log(logger, logging.DEBUG),
+        reraise=True,
+    )
+    async def acreate_text_completion(
+        self, text_input: str, system_prompt: str, history: list = None, **kwargs
+    ) -> str:
+        """
+        Generate a plain-text completion without structured-output overhead.
+
+        Skips instructor's schema injection and validation round-trip — the JSON
+        schema alone costs a few hundred input tokens per call — and returns the
+        raw message content. Used for response_model=str workloads such as
+        summarization.
+
+        Parameters:
+        -----------
+
+            - text_input (str): The input text provided by the user.
+            - system_prompt (str): The system prompt that guides the response generation.
+
+        Returns:
+        --------
+
+            - str: The generated completion text.
+        """
+        async with llm_rate_limiter_context_manager():
+            response = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(text_input, system_prompt, history),
+                response_model=None,
+            )
+
+        return response.choices[0].message.content
+
+    async def acreate_structured_outputs_batched(
+        self,
+        text_inputs: List[str],
+        system_prompt: str,
+        response_model: Type[BaseModel],
+        batch_size: int = 8,
+    ) -> List[BaseModel]:
+        """
+        Generate structured outputs for many inputs, packing several per request.
+
+        Issuing one request per input pays the system-prompt (and schema)
+        overhead once per item; packing batch_size numbered items into a single
+        request with a List[response_model] schema amortizes that fixed cost
+        across the batch. If a packed request fails validation or comes back
+        with the wrong number of outputs, the batch falls back to one request
+        per item, so results are never silently misaligned.
+
+        Parameters:
+        -----------
+
+            - text_inputs (List[str]): The input texts to process independently.
+            - system_prompt (str): The system prompt applied to every item.
+            - response_model (Type[BaseModel]): The model type each per-item output
+              should conform to.
+            - batch_size (int): Maximum number of items packed into one request.
+              (default 8)
+
+        Returns:
+        --------
+
+            - List[BaseModel]: One structured output per input, in input order.
+        """
+        results: List[BaseModel] = []
+
+        for start in range(0, len(text_inputs), batch_size):
+            batch = text_inputs[start : start + batch_size]
+
+            if len(batch) == 1:
+                results.append(
+                    await self.acreate_structured_output(batch[0], system_prompt, response_model)
+                )
+                continue
+
+            numbered_items = "\n\n".join(f"{index + 1}) {item}" for index, item in enumerate(batch))
+            batch_input = (
+                f"Process each of the {len(batch)} numbered items below independently and "
+                "return a JSON array with exactly one output per item, in the same order.\n\n"
+                f"Items:\n{numbered_items}"
+            )
+
+            batch_results = None
+            try:
+                batch_results = await self.acreate_structured_output(
+                    batch_input, system_prompt, List[response_model]
+                )
+            except (ValidationError, InstructorRetryException) as error:
+                logger.warning(
+                    f"Batched structured output failed validation, retrying per item: {error}"
+                )
+
+            if batch_results is None or len(batch_results) != len(batch):
+                if batch_results is not None:
+                    logger.warning(
+                        f"Batched structured output returned {len(batch_results)} results "
+                        f"for {len(batch)} items, retrying per item."
+                    )
+                for item in batch:
+                    results.append(
+                        await self.acreate_structured_output(item, system_prompt, response_model)
+                    )
+            else:
+                results.extend(batch_results)
+
+        return results
+
     @retry(
         stop=stop_after_delay(128),
         wait=wait_exponential_jitter(8, 128),
-        retry=retry_if_not_exception_type(litellm.exceptions.NotFoundError),
+        retry=retry_if_exception(_is_retryable_transcription_error),
         before_sleep=before_sleep_log(logger, logging.DEBUG),
         reraise=True,
     )
@@ -132,9 +400,16 @@ class OllamaAPIAdapter(LLMInterface):
         """
         Generate an audio transcript from a user query.
 
-        This synchronous method takes an input audio file and returns its transcription. Raises
-        a FileNotFoundError if the input file does not exist, and raises a ValueError if
-        transcription fails or returns no text.
+        This asynchronous method takes an input audio file and returns its transcription. The
+        file is streamed to the transcription endpoint as a chunked multipart upload, so peak
+        memory stays bounded by the chunk size instead of the file size and the upload
+        overlaps with the disk read. Raises a FileNotFoundError if the input file does not
+        exist, and raises a ValueError if transcription fails or returns no text.
+
+        Note: since the call goes through httpx directly, failed requests raise httpx
+        exceptions (httpx.HTTPStatusError for non-2xx responses, httpx.TimeoutException and
+        friends for transport failures) rather than OpenAI SDK error types. Only 5xx and
+        transport errors are retried; 4xx responses fail immediately.
 
         Parameters:
         -----------
@@ -148,25 +423,27 @@ class OllamaAPIAdapter(LLMInterface):
         """
 
         async with open_data_file(input, mode="rb") as audio_file:
-            transcription = self.aclient.audio.transcriptions.create(
-                model="whisper-1",  # Ensure the correct model for transcription
-                file=audio_file,
-                language="en",
-            )
+            # Hand httpx the open file handle instead of buffering it through the
+            # SDK: the multipart body is then read and uploaded in fixed-size chunks.
+            async with httpx.AsyncClient() as http_client:
+                response = await http_client.post(
+                    f"{self.endpoint.rstrip('/')}/audio/transcriptions",
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    files={
+                        "file": (os.path.basename(input), audio_file, "application/octet-stream")
+                    },
+                    data={"model": "whisper-1", "language": "en"},
+                )
+
+        response.raise_for_status()
+        transcription = response.json()
 
         # Ensure the response contains a valid transcript
-        if not hasattr(transcription, "text"):
+        if "text" not in transcription:
             raise ValueError("Transcription failed. No text returned.")
 
-        return transcription.text
+        return transcription["text"]
 
-    @retry(
-        stop=stop_after_delay(128),
-        wait=wait_exponential_jitter(2, 128),
-        retry=retry_if_not_exception_type(litellm.exceptions.NotFoundError),
-        before_sleep=before_sleep_log(logger, logging.DEBUG),
-        reraise=True,
-    )
     async def transcribe_image(self, input: str, **kwargs) -> str:
         """
         Transcribe content from an image using base64 encoding.
@@ -175,6 +452,10 @@ class OllamaAPIAdapter(LLMInterface):
         routes through litellm to the external vision API instead of local Ollama.
         Falls back to local Ollama if no separate vision model is set.
 
+        The image is read and encoded exactly once; only the HTTP request itself is
+        retried, so transient failures don't redo the file I/O and encode work on
+        every backoff attempt.
+
         Parameters:
         -----------
 
@@ -187,8 +468,21 @@ class OllamaAPIAdapter(LLMInterface):
         """
 
         async with open_data_file(input, mode="rb") as image_file:
-            encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
+            # CPU-bound encode runs in a worker thread so concurrent LLM requests
+            # on the event loop are not stalled by a multi-MB image.
+            encoded_image = await asyncio.to_thread(_encode_b64_chunked, image_file)
+
+        return await self._transcribe_image_encoded(encoded_image, **kwargs)
 
+    @retry(
+        stop=stop_after_delay(32),
+        wait=wait_exponential_jitter(2, 128),
+        retry=retry_if_not_exception_type(_NON_RETRYABLE_EXCEPTIONS),
+        before_sleep=before_sleep_log(logger, logging.DEBUG),
+        reraise=True,
+    )
+    async def _transcribe_image_encoded(self, encoded_image: str, **kwargs) -> str:
+        """Issue the retried vision request for an already base64-encoded image."""
         # Use litellm for external vision model (e.g. OpenRouter)
         # This avoids calling local Ollama for vision when a separate vision API is configured
         async with llm_rate_limiter_context_manager():
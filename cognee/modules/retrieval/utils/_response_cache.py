@@ -0,0 +1,183 @@
+"""Exact-match response cache for LLM completions.
+
+Caches structured outputs keyed by an MD5 hash of the model, prompts and
+response model name, so repeated identical completion requests are served
+from memory (or optionally Redis) instead of a full LLM round-trip.
+
+Enable with the ``COGNEE_LLM_CACHE`` environment variable. Caching is
+skipped for sampled (``temperature > 0``) requests, since their outputs are
+not deterministic.
+"""
+
+import os
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional, Type
+
+from cognee.infrastructure.llm import get_llm_config
+from cognee.infrastructure.llm.LLMGateway import LLMGateway
+from cognee.shared.logging_utils import get_logger
+
+logger = get_logger("response_cache")
+
+DEFAULT_CACHE_MAX_SIZE = 1024
+DEFAULT_CACHE_TTL = 3600
+
+_local_cache: "OrderedDict[str, str]" = OrderedDict()
+_redis_client = None
+
+
+def response_cache_enabled() -> bool:
+    """Check whether the exact-match LLM response cache is enabled."""
+    return os.environ.get("COGNEE_LLM_CACHE", "false").lower() in ("true", "1")
+
+
+def _hash_request(
+    model: str, system_prompt: str, text_input: str, response_model: Type, history: Any = None
+) -> str:
+    """Compute a stable cache key for a completion request."""
+    raw_key = f"{model}|{system_prompt}|{text_input}|{response_model.__name__}"
+    if history:
+        raw_key += f"|{json.dumps(history, sort_keys=True, default=str)}"
+    return hashlib.md5(raw_key.encode("utf-8")).hexdigest()
+
+
+def _get_redis_client():
+    """Return an async Redis client when the cache backend is Redis, otherwise None."""
+    global _redis_client
+
+    if _redis_client is not None:
+        return _redis_client
+
+    try:
+        from cognee.infrastructure.databases.cache.config import get_cache_config
+
+        cache_config = get_cache_config()
+        if cache_config.cache_backend != "redis":
+            return None
+
+        import redis.asyncio as aioredis
+
+        _redis_client = aioredis.Redis(
+            host=cache_config.cache_host,
+            port=cache_config.cache_port,
+            username=cache_config.cache_username,
+            password=cache_config.cache_password,
+            decode_responses=True,
+        )
+        return _redis_client
+    except Exception as e:
+        logger.debug(f"Redis response cache unavailable, using in-process cache only: {e}")
+        return None
+
+
+def _local_cache_get(key: str) -> Optional[str]:
+    value = _local_cache.get(key)
+    if value is not None:
+        _local_cache.move_to_end(key)
+    return value
+
+
+def _local_cache_set(key: str, value: str) -> None:
+    _local_cache[key] = value
+    _local_cache.move_to_end(key)
+    max_size = int(os.environ.get("COGNEE_LLM_CACHE_MAX_SIZE", DEFAULT_CACHE_MAX_SIZE))
+    while len(_local_cache) > max_size:
+        _local_cache.popitem(last=False)
+
+
+async def _cache_get(key: str) -> Optional[str]:
+    """Look up a cached response, checking the in-process cache before Redis."""
+    value = _local_cache_get(key)
+    if value is not None:
+        return value
+
+    redis_client = _get_redis_client()
+    if redis_client is not None:
+        try:
+            value = await redis_client.get(f"llm:{key}")
+            if value is not None:
+                _local_cache_set(key, value)
+            return value
+        except Exception as e:
+            logger.warning(f"Redis response cache read failed, continuing without cache: {e}")
+
+    return None
+
+
+async def _cache_set(key: str, value: str) -> None:
+    """Store a serialized response in the in-process cache and optionally Redis."""
+    _local_cache_set(key, value)
+
+    redis_client = _get_redis_client()
+    if redis_client is not None:
+        try:
+            ttl = int(os.environ.get("COGNEE_LLM_CACHE_TTL", DEFAULT_CACHE_TTL))
+            await redis_client.set(f"llm:{key}", value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Redis response cache write failed, continuing without cache: {e}")
+
+
+async def _call_gateway(text_input: str, system_prompt: str, response_model: Type, **kwargs) -> Any:
+    """Dispatch to the gateway, using the plain-text fast path for str responses."""
+    if response_model is str:
+        return await LLMGateway.acreate_text_completion(
+            text_input=text_input,
+            system_prompt=system_prompt,
+            **kwargs,
+        )
+    return await LLMGateway.acreate_structured_output(
+        text_input=text_input,
+        system_prompt=system_prompt,
+        response_model=response_model,
+        **kwargs,
+    )
+
+
+def _serialize_response(response: Any, response_model: Type) -> str:
+    if response_model is str:
+        return json.dumps(response)
+    return response.model_dump_json()
+
+
+def _deserialize_response(cached: str, response_model: Type) -> Any:
+    if response_model is str:
+        return json.loads(cached)
+    return response_model.model_validate_json(cached)
+
+
+async def cached_acreate_structured_output(
+    text_input: str, system_prompt: str, response_model: Type, **kwargs
+) -> Any:
+    """
+    Generate a structured output through LLMGateway with an exact-match cache in front.
+
+    Checks the in-process (and optionally Redis) cache before issuing the LLM
+    request; on a miss the gateway response is serialized and stored for reuse.
+    Falls through to an uncached call when caching is disabled or the request
+    uses a non-zero sampling temperature.
+    """
+    if not response_cache_enabled() or kwargs.get("temperature", 0) > 0:
+        return await _call_gateway(text_input, system_prompt, response_model, **kwargs)
+
+    llm_config = get_llm_config()
+    key = _hash_request(
+        llm_config.llm_model, system_prompt, text_input, response_model, kwargs.get("history")
+    )
+
+    cached = await _cache_get(key)
+    if cached is not None:
+        try:
+            return _deserialize_response(cached, response_model)
+        except Exception as e:
+            logger.warning(f"Failed to deserialize cached LLM response, regenerating: {e}")
+
+    response = await _call_gateway(text_input, system_prompt, response_model, **kwargs)
+
+    try:
+        await _cache_set(key, _serialize_response(response, response_model))
+    except Exception as e:
+        logger.warning(f"Failed to cache LLM response: {e}")
+
+    return response
@@ -0,0 +1,120 @@
+"""Semantic (embedding-similarity) cache for LLM completions.
+
+Where the exact-match cache only serves byte-identical prompts, this cache
+embeds the rendered user prompt and serves a stored response when a previous
+prompt is close enough in embedding space — paraphrased questions over the
+same context then skip the LLM call entirely.
+
+Entries are isolated per (system prompt hash, response model name) so
+responses generated under one task prompt are never returned for another.
+Enable with ``COGNEE_SEMANTIC_CACHE``; tune the cosine-similarity threshold
+with ``COGNEE_SEMANTIC_CACHE_THRESHOLD`` (default 0.95).
+"""
+
+import os
+import json
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from cognee.shared.logging_utils import get_logger
+
+logger = get_logger("semantic_cache")
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_MAX_ENTRIES_PER_CONTEXT = 512
+
+
+def semantic_cache_enabled() -> bool:
+    """Check whether the semantic LLM completion cache is enabled."""
+    return os.environ.get("COGNEE_SEMANTIC_CACHE", "false").lower() in ("true", "1")
+
+
+def get_similarity_threshold() -> float:
+    """Read the cosine-similarity threshold for semantic cache hits."""
+    return float(os.environ.get("COGNEE_SEMANTIC_CACHE_THRESHOLD", DEFAULT_SIMILARITY_THRESHOLD))
+
+
+class SemanticCompletionCache:
+    """
+    In-process nearest-neighbor cache of (prompt embedding, serialized response) pairs.
+
+    Each (system prompt, response model) pair gets its own index so cached
+    responses are only reused within the task context that produced them.
+    """
+
+    def __init__(self, max_entries_per_context: int = DEFAULT_MAX_ENTRIES_PER_CONTEXT):
+        self.max_entries_per_context = max_entries_per_context
+        self._indexes: Dict[Tuple[str, str], List[Tuple[np.ndarray, str]]] = {}
+
+    @staticmethod
+    def _context_key(system_prompt: str, response_model: Type) -> Tuple[str, str]:
+        system_prompt_hash = hashlib.md5(system_prompt.encode("utf-8")).hexdigest()
+        return (system_prompt_hash, response_model.__name__)
+
+    @staticmethod
+    async def _embed(user_prompt: str) -> np.ndarray:
+        from cognee.infrastructure.databases.vector.embeddings import get_embedding_engine
+
+        embedding_engine = get_embedding_engine()
+        embeddings = await embedding_engine.embed_text([user_prompt])
+        vector = np.asarray(embeddings[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def get(
+        self, user_prompt: str, system_prompt: str, response_model: Type
+    ) -> Tuple[Optional[Any], Optional[np.ndarray]]:
+        """
+        Look up the nearest cached response for a prompt.
+
+        Returns a (response, embedding) tuple; the response is None on a miss,
+        while the embedding is returned either way so a subsequent `add` does
+        not have to re-embed the prompt.
+        """
+        embedding = await self._embed(user_prompt)
+        index = self._indexes.get(self._context_key(system_prompt, response_model), [])
+
+        if not index:
+            return None, embedding
+
+        similarities = [float(np.dot(embedding, cached_embedding)) for cached_embedding, _ in index]
+        best_position = int(np.argmax(similarities))
+
+        if similarities[best_position] >= get_similarity_threshold():
+            cached_json = index[best_position][1]
+            try:
+                if response_model is str:
+                    return json.loads(cached_json), embedding
+                return response_model.model_validate_json(cached_json), embedding
+            except Exception as e:
+                logger.warning(f"Failed to deserialize semantic cache entry, regenerating: {e}")
+
+        return None, embedding
+
+    def add(
+        self,
+        embedding: np.ndarray,
+        response: Any,
+        system_prompt: str,
+        response_model: Type,
+    ) -> None:
+        """Store a response under its prompt embedding for future similarity lookups."""
+        if response_model is str:
+            response_json = json.dumps(response)
+        else:
+            response_json = response.model_dump_json()
+
+        index = self._indexes.setdefault(self._context_key(system_prompt, response_model), [])
+        index.append((embedding, response_json))
+        if len(index) > self.max_entries_per_context:
+            index.pop(0)
+
+
+_semantic_cache = SemanticCompletionCache()
+
+
+def get_semantic_cache() -> SemanticCompletionCache:
+    """Return the process-wide semantic completion cache."""
+    return _semantic_cache
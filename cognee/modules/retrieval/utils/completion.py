@@ -1,7 +1,37 @@
+"""LLM completion helpers for retrieval.
+
+Context assembled from retrieved chunks is ordered deterministically (by
+content hash) before prompt rendering, so the same set of retrieved items
+always produces a byte-identical prompt regardless of retrieval order. This
+keeps response-cache keys and provider-side prompt-cache prefixes stable.
+"""
+
+import asyncio
+import hashlib
 import os
-from typing import Optional, Type, Any
+from typing import List, Optional, Type, Any, Union
 from cognee.infrastructure.llm.LLMGateway import LLMGateway
 from cognee.infrastructure.llm.prompts import render_prompt, read_query_prompt
+from cognee.modules.retrieval.utils._response_cache import cached_acreate_structured_output
+from cognee.modules.retrieval.utils._semantic_cache import (
+    get_semantic_cache,
+    semantic_cache_enabled,
+)
+from cognee.shared.logging_utils import get_logger
+
+logger = get_logger("completion")
+
+
+# BAML override-path caches: client registries are keyed by connection
+# parameters and dynamic type builders by response model, so repeated search
+# calls reuse them instead of rebuilding both on every request.
+_registry_cache: dict = {}
+_type_builder_cache: dict = {}
+
+
+def _sort_context_items(context: list) -> list:
+    """Sort retrieved context items by content hash for deterministic prompt rendering."""
+    return sorted(context, key=lambda item: hashlib.md5(str(item).encode("utf-8")).hexdigest())
 
 
 def _get_search_llm_override():
@@ -36,22 +66,33 @@ async def _generate_completion_with_override(
             TypeBuilder,
         )
 
-        # Create a custom client registry for search
-        registry = ClientRegistry()
-        registry.add_llm_client(
-            name="search_client",
-            provider="openai",
-            options={
-                "model": override_config["model"],
-                "base_url": override_config["endpoint"],
-                "api_key": override_config["api_key"],
-            },
+        # Reuse the custom client registry for identical search configurations
+        registry_key = (
+            override_config["model"],
+            override_config["endpoint"],
+            override_config["api_key"],
         )
-        registry.set_primary("search_client")
-
-        # Create dynamic type for response
-        tb = TypeBuilder()
-        type_builder = create_dynamic_baml_type(tb, tb.ResponseModel, response_model)
+        registry = _registry_cache.get(registry_key)
+        if registry is None:
+            registry = ClientRegistry()
+            registry.add_llm_client(
+                name="search_client",
+                provider="openai",
+                options={
+                    "model": override_config["model"],
+                    "base_url": override_config["endpoint"],
+                    "api_key": override_config["api_key"],
+                },
+            )
+            registry.set_primary("search_client")
+            _registry_cache[registry_key] = registry
+
+        # Reuse the dynamic type for the response model
+        type_builder = _type_builder_cache.get(response_model)
+        if type_builder is None:
+            tb = TypeBuilder()
+            type_builder = create_dynamic_baml_type(tb, tb.ResponseModel, response_model)
+            _type_builder_cache[response_model] = type_builder
 
         result = await b.AcreateStructuredOutput(
             text_input=text_input,
@@ -64,8 +105,7 @@ async def _generate_completion_with_override(
         return response_model.model_validate(result.dict())
     except Exception as e:
         # Fall back to default on error
-        import logging
-        logging.getLogger(__name__).warning(f"Search LLM override failed, using default: {e}")
+        logger.warning(f"Search LLM override failed, using default: {e}")
         return await LLMGateway.acreate_structured_output(
             text_input=text_input,
             system_prompt=system_prompt,
@@ -79,33 +119,79 @@ async def generate_completion(
     user_prompt_path: str,
     system_prompt_path: str,
     system_prompt: Optional[str] = None,
-    conversation_history: Optional[str] = None,
+    conversation_history: Optional[Union[str, List[dict]]] = None,
     response_model: Type = str,
 ) -> Any:
-    """Generates a completion using LLM with given context and prompts."""
+    """
+    Generates a completion using LLM with given context and prompts.
+
+    conversation_history may be a preformatted string or a list of
+    {'role', 'content'} message dicts; either way it is passed to the LLM as
+    separate turns preceding the rendered task prompt.
+    """
+    if isinstance(context, list):
+        context = _sort_context_items(context)
+
     args = {"question": query, "context": context}
     user_prompt = render_prompt(user_prompt_path, args)
     system_prompt = system_prompt if system_prompt else read_query_prompt(system_prompt_path)
 
+    # History travels as separate earlier messages (not concatenated into a prompt)
+    # so both the system prompt and the rendered task prompt stay byte-identical
+    # across turns and provider-side prompt caching can reuse the prefix.
+    history = None
     if conversation_history:
-        #:TODO: I would separate the history and put it into the system prompt but we have to test what works best with longer convos
-        system_prompt = conversation_history + "\nTASK:" + system_prompt
+        if isinstance(conversation_history, list):
+            history = conversation_history
+        else:
+            history = [{"role": "user", "content": conversation_history}]
+
+    # Paraphrased repeats of the same question can be served from the semantic
+    # cache. Lookup failures (embedding engine misconfigured, rate limited)
+    # degrade to a cache miss rather than failing the completion.
+    semantic_embedding = None
+    if semantic_cache_enabled():
+        try:
+            cached_response, semantic_embedding = await get_semantic_cache().get(
+                user_prompt, system_prompt, response_model
+            )
+            if cached_response is not None:
+                return cached_response
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed, continuing without cache: {e}")
+            semantic_embedding = None
 
     # Check for search-specific LLM override
     override_config = _get_search_llm_override()
     if override_config:
-        return await _generate_completion_with_override(
-            text_input=user_prompt,
+        # The BAML override path has no history parameter; fold history into the
+        # user input there instead of dropping it.
+        text_input = user_prompt
+        if history:
+            history_text = "\n".join(entry["content"] for entry in history)
+            text_input = history_text + "\n" + user_prompt
+        response = await _generate_completion_with_override(
+            text_input=text_input,
             system_prompt=system_prompt,
             response_model=response_model,
             override_config=override_config,
         )
+    else:
+        extra_kwargs = {"history": history} if history else {}
+        response = await cached_acreate_structured_output(
+            text_input=user_prompt,
+            system_prompt=system_prompt,
+            response_model=response_model,
+            **extra_kwargs,
+        )
 
-    return await LLMGateway.acreate_structured_output(
-        text_input=user_prompt,
-        system_prompt=system_prompt,
-        response_model=response_model,
-    )
+    if semantic_embedding is not None:
+        try:
+            get_semantic_cache().add(semantic_embedding, response, system_prompt, response_model)
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed, response not cached: {e}")
+
+    return response
 
 
 async def summarize_text(
@@ -116,8 +202,32 @@ async def summarize_text(
     """Summarizes text using LLM with the specified prompt."""
     system_prompt = system_prompt if system_prompt else read_query_prompt(system_prompt_path)
 
-    return await LLMGateway.acreate_structured_output(
+    return await cached_acreate_structured_output(
         text_input=text,
         system_prompt=system_prompt,
         response_model=str,
     )
+
+
+async def summarize_texts(
+    texts: List[str],
+    *,
+    concurrency: int = 20,
+    **kwargs,
+) -> List[str]:
+    """
+    Summarizes multiple texts concurrently, preserving input order.
+
+    Requests are issued through asyncio.gather with a semaphore capping the
+    number of in-flight LLM calls, collapsing wall-clock time from one
+    round-trip per text to roughly the slowest round-trip per batch. The
+    existing LLM rate limiter still applies to each individual call. Extra
+    keyword arguments are forwarded to summarize_text.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def summarize_one(text: str) -> str:
+        async with semaphore:
+            return await summarize_text(text, **kwargs)
+
+    return await asyncio.gather(*(summarize_one(text) for text in texts))
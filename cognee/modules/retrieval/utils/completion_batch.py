@@ -0,0 +1,147 @@
+"""Offline batch summarization through provider batch endpoints.
+
+For large ingestion jobs (thousands of documents), real-time completion calls
+are twice the price of the batch endpoints and quickly exhaust per-minute rate
+limits. summarize_text_batch trades latency for cost and throughput: it
+submits all requests as a single OpenAI Batch API job (50% discount, separate
+and much higher quota, 24h completion window), polls until the job finishes
+and returns results in input order.
+
+Only use this from pipelines that can tolerate asynchronous completion — the
+batch may take hours to finish.
+"""
+
+import io
+import json
+import asyncio
+from typing import List, Optional
+
+from cognee.infrastructure.llm import get_llm_config
+from cognee.infrastructure.llm.prompts import read_query_prompt
+from cognee.shared.logging_utils import get_logger
+
+logger = get_logger("completion_batch")
+
+DEFAULT_POLL_INTERVAL = 30
+
+_TERMINAL_BATCH_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def _build_batch_jsonl(
+    texts: List[str], system_prompt: str, model: str, max_completion_tokens: int
+) -> bytes:
+    """Build the JSONL payload for a chat-completions batch job."""
+    lines = []
+    for index, text in enumerate(texts):
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": text},
+                        ],
+                        "max_completion_tokens": max_completion_tokens,
+                    },
+                }
+            )
+        )
+    return "\n".join(lines).encode("utf-8")
+
+
+async def summarize_text_batch(
+    texts: List[str],
+    provider: str = "openai",
+    system_prompt_path: str = "summarize_search_results.txt",
+    system_prompt: Optional[str] = None,
+    poll_interval: int = DEFAULT_POLL_INTERVAL,
+) -> List[str]:
+    """
+    Summarizes texts through the provider's Batch API, returning summaries in input order.
+
+    Builds a JSONL batch file with one chat-completion request per text,
+    submits it, polls the job status every `poll_interval` seconds until it
+    reaches a terminal state, then downloads the output file and reassembles
+    results by custom_id. Raises a ValueError for unsupported providers and a
+    RuntimeError when the batch job does not complete successfully.
+
+    Parameters:
+    -----------
+
+        - texts (List[str]): The texts to summarize.
+        - provider (str): Batch backend to use; currently only 'openai'
+          (and OpenAI-compatible batch endpoints). (default 'openai')
+        - system_prompt_path (str): Path to the summarization system prompt.
+          (default 'summarize_search_results.txt')
+        - system_prompt (Optional[str]): Inline system prompt overriding the file.
+          (default None)
+        - poll_interval (int): Seconds between batch status polls. (default 30)
+
+    Returns:
+    --------
+
+        - List[str]: One summary per input text, in input order; None for
+          items the batch returned no output for.
+    """
+    if provider != "openai":
+        raise ValueError(
+            f"Unsupported batch provider: '{provider}'. Supported providers are: 'openai'"
+        )
+
+    if not texts:
+        return []
+
+    from openai import AsyncOpenAI
+
+    llm_config = get_llm_config()
+    system_prompt = system_prompt if system_prompt else read_query_prompt(system_prompt_path)
+
+    # litellm-style model names are prefixed with the provider ("openai/gpt-4o-mini")
+    model = llm_config.llm_model.split("/", 1)[-1]
+
+    client = AsyncOpenAI(
+        api_key=llm_config.llm_api_key,
+        base_url=llm_config.llm_endpoint or None,
+    )
+
+    jsonl_payload = _build_batch_jsonl(
+        texts, system_prompt, model, llm_config.llm_max_completion_tokens
+    )
+
+    batch_file = await client.files.create(file=io.BytesIO(jsonl_payload), purpose="batch")
+
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted summarization batch {batch.id} with {len(texts)} requests")
+
+    while batch.status not in _TERMINAL_BATCH_STATUSES:
+        await asyncio.sleep(poll_interval)
+        batch = await client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Summarization batch {batch.id} ended with status '{batch.status}'")
+
+    output_file = await client.files.content(batch.output_file_id)
+
+    results_by_id = {}
+    for line in output_file.text.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        response_body = entry.get("response", {}).get("body", {})
+        choices = response_body.get("choices", [])
+        if choices:
+            results_by_id[entry["custom_id"]] = choices[0]["message"]["content"]
+
+    missing = len(texts) - len(results_by_id)
+    if missing:
+        logger.warning(f"Summarization batch {batch.id} returned no output for {missing} items")
+
+    return [results_by_id.get(str(index)) for index in range(len(texts))]
@@ -0,0 +1,97 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from cognee.infrastructure.llm.LLMGateway import LLMGateway
+
+
+class HistoryAwareClient:
+    """Fake adapter that declares a history parameter, like OllamaAPIAdapter."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def acreate_structured_output(
+        self, text_input, system_prompt, response_model, history=None, **kwargs
+    ):
+        self.calls.append({"text_input": text_input, "history": history, "kwargs": kwargs})
+        return "ok"
+
+
+class HistoryUnawareClient:
+    """Fake adapter that forwards unknown kwargs to its SDK, like the OpenAI adapter."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def acreate_structured_output(self, text_input, system_prompt, response_model, **kwargs):
+        self.calls.append({"text_input": text_input, "kwargs": kwargs})
+        return "ok"
+
+
+def _patch_gateway(client):
+    return (
+        patch(
+            "cognee.infrastructure.llm.LLMGateway.get_llm_config",
+            return_value=MagicMock(structured_output_framework="instructor"),
+        ),
+        patch(
+            "cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.get_llm_client.get_llm_client",
+            return_value=client,
+        ),
+    )
+
+
+class TestGatewayHistoryRouting:
+    @pytest.mark.asyncio
+    async def test_history_passed_to_adapter_that_declares_it(self):
+        """Test history reaches history-aware adapters as a kwarg, with the input untouched."""
+        client = HistoryAwareClient()
+        config_patch, client_patch = _patch_gateway(client)
+        history = [{"role": "user", "content": "earlier question"}]
+
+        with config_patch, client_patch:
+            await LLMGateway.acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+                history=history,
+            )
+
+        assert client.calls[0]["history"] == history
+        assert client.calls[0]["text_input"] == "question"
+
+    @pytest.mark.asyncio
+    async def test_history_folded_into_input_for_other_adapters(self):
+        """Test adapters without history support get it concatenated into the prompt text."""
+        client = HistoryUnawareClient()
+        config_patch, client_patch = _patch_gateway(client)
+        history = [{"role": "user", "content": "earlier question"}]
+
+        with config_patch, client_patch:
+            await LLMGateway.acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+                history=history,
+            )
+
+        # The kwarg must never leak into the adapter call, where it would be
+        # forwarded into the provider request body.
+        assert "history" not in client.calls[0]["kwargs"]
+        assert client.calls[0]["text_input"] == "earlier question\nquestion"
+
+    @pytest.mark.asyncio
+    async def test_no_history_leaves_call_unchanged(self):
+        """Test calls without history are forwarded as before."""
+        client = HistoryUnawareClient()
+        config_patch, client_patch = _patch_gateway(client)
+
+        with config_patch, client_patch:
+            await LLMGateway.acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+            )
+
+        assert client.calls[0]["text_input"] == "question"
+        assert "history" not in client.calls[0]["kwargs"]
@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from pydantic import BaseModel, ValidationError
+
+from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.ollama.adapter import (
+    OllamaAPIAdapter,
+)
+
+
+class FakeOutput(BaseModel):
+    label: str
+
+
+def make_adapter():
+    return OllamaAPIAdapter(
+        endpoint="http://localhost:11434/v1",
+        api_key="ollama",
+        model="llama3",
+        name="Ollama",
+        max_completion_tokens=4096,
+    )
+
+
+class TestAcreateStructuredOutputsBatched:
+    @pytest.mark.asyncio
+    async def test_packs_items_and_preserves_order(self):
+        """Test inputs are packed per batch and results come back flattened in order."""
+        adapter = make_adapter()
+        adapter.acreate_structured_output = AsyncMock(
+            side_effect=[
+                [FakeOutput(label="a"), FakeOutput(label="b")],
+                [FakeOutput(label="c"), FakeOutput(label="d")],
+                FakeOutput(label="e"),
+            ]
+        )
+
+        results = await adapter.acreate_structured_outputs_batched(
+            ["a", "b", "c", "d", "e"],
+            system_prompt="system",
+            response_model=FakeOutput,
+            batch_size=2,
+        )
+
+        assert [result.label for result in results] == ["a", "b", "c", "d", "e"]
+        # Two packed requests plus one single-item request instead of five.
+        assert adapter.acreate_structured_output.await_count == 3
+        packed_input = adapter.acreate_structured_output.await_args_list[0].args[0]
+        assert "1) a" in packed_input
+        assert "2) b" in packed_input
+
+    @pytest.mark.asyncio
+    async def test_falls_back_per_item_on_validation_failure(self):
+        """Test a batch that fails validation is retried one request per item."""
+        adapter = make_adapter()
+        adapter.acreate_structured_output = AsyncMock(
+            side_effect=[
+                ValidationError.from_exception_data("FakeOutput", []),
+                FakeOutput(label="a"),
+                FakeOutput(label="b"),
+            ]
+        )
+
+        results = await adapter.acreate_structured_outputs_batched(
+            ["a", "b"],
+            system_prompt="system",
+            response_model=FakeOutput,
+            batch_size=2,
+        )
+
+        assert [result.label for result in results] == ["a", "b"]
+        assert adapter.acreate_structured_output.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_falls_back_per_item_on_wrong_result_count(self):
+        """Test a batch returning the wrong number of outputs is retried per item."""
+        adapter = make_adapter()
+        adapter.acreate_structured_output = AsyncMock(
+            side_effect=[
+                [FakeOutput(label="a")],
+                FakeOutput(label="a"),
+                FakeOutput(label="b"),
+            ]
+        )
+
+        results = await adapter.acreate_structured_outputs_batched(
+            ["a", "b"],
+            system_prompt="system",
+            response_model=FakeOutput,
+            batch_size=2,
+        )
+
+        assert [result.label for result in results] == ["a", "b"]
+        assert adapter.acreate_structured_output.await_count == 3
@@ -0,0 +1,39 @@
+import asyncio
+
+from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.ollama.adapter import (
+    _get_instructor_client,
+)
+
+
+class TestInstructorClientCache:
+    def test_client_shared_within_one_loop(self):
+        """Test repeated lookups on the same loop return the same pooled client."""
+
+        async def get_twice():
+            first = _get_instructor_client("http://localhost:11434/v1", "ollama", "json_mode")
+            second = _get_instructor_client("http://localhost:11434/v1", "ollama", "json_mode")
+            return first, second
+
+        first, second = asyncio.run(get_twice())
+        assert first is second
+
+    def test_client_not_reused_across_loops(self):
+        """Test a fresh event loop gets a fresh client instead of one bound to a closed loop."""
+
+        async def get_client():
+            return _get_instructor_client("http://localhost:11434/v1", "ollama", "json_mode")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+
+    def test_different_connection_parameters_get_different_clients(self):
+        """Test clients are not shared between distinct endpoints."""
+
+        async def get_clients():
+            first = _get_instructor_client("http://localhost:11434/v1", "ollama", "json_mode")
+            second = _get_instructor_client("http://localhost:11435/v1", "ollama", "json_mode")
+            return first, second
+
+        first, second = asyncio.run(get_clients())
+        assert first is not second
@@ -0,0 +1,32 @@
+import httpx
+
+from cognee.infrastructure.llm.structured_output_framework.litellm_instructor.llm.ollama.adapter import (
+    _is_retryable_transcription_error,
+)
+
+
+def _status_error(status_code):
+    request = httpx.Request("POST", "http://localhost:11434/v1/audio/transcriptions")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestTranscriptionRetryPredicate:
+    def test_client_errors_are_not_retried(self):
+        """Test 4xx transcription responses fail immediately."""
+        for status_code in (400, 401, 413):
+            assert not _is_retryable_transcription_error(_status_error(status_code))
+
+    def test_server_errors_are_retried(self):
+        """Test 5xx transcription responses keep the backoff window."""
+        for status_code in (500, 503):
+            assert _is_retryable_transcription_error(_status_error(status_code))
+
+    def test_transport_failures_are_retried(self):
+        """Test timeouts and dropped connections are retried."""
+        assert _is_retryable_transcription_error(httpx.ReadTimeout("timed out"))
+        assert _is_retryable_transcription_error(httpx.ConnectError("refused"))
+
+    def test_missing_transcript_is_not_retried(self):
+        """Test the ValueError for a response without text stays non-retryable."""
+        assert not _is_retryable_transcription_error(ValueError("Transcription failed."))
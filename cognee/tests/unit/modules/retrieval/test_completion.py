@@ -15,7 +15,7 @@ class TestGenerateCompletion:
                 return_value="User prompt text",
             ),
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ) as mock_llm,
@@ -34,7 +34,6 @@ class TestGenerateCompletion:
             mock_llm.assert_awaited_once_with(
                 text_input="User prompt text",
                 system_prompt="Custom system prompt",
-                response_model=str,
             )
 
     @pytest.mark.asyncio
@@ -52,7 +51,7 @@ class TestGenerateCompletion:
                 return_value="System prompt from file",
             ),
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ) as mock_llm,
@@ -70,7 +69,6 @@ class TestGenerateCompletion:
             mock_llm.assert_awaited_once_with(
                 text_input="User prompt text",
                 system_prompt="System prompt from file",
-                response_model=str,
             )
 
     @pytest.mark.asyncio
@@ -88,7 +86,7 @@ class TestGenerateCompletion:
                 return_value="System prompt from file",
             ),
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ) as mock_llm,
@@ -104,15 +102,16 @@ class TestGenerateCompletion:
             )
 
             assert result == mock_llm_response
-            expected_system_prompt = (
-                "Previous conversation:\nQ: What is ML?\nA: ML is machine learning"
-                + "\nTASK:"
-                + "System prompt from file"
-            )
+            expected_history = [
+                {
+                    "role": "user",
+                    "content": "Previous conversation:\nQ: What is ML?\nA: ML is machine learning",
+                }
+            ]
             mock_llm.assert_awaited_once_with(
                 text_input="User prompt text",
-                system_prompt=expected_system_prompt,
-                response_model=str,
+                system_prompt="System prompt from file",
+                history=expected_history,
             )
 
     @pytest.mark.asyncio
@@ -126,7 +125,7 @@ class TestGenerateCompletion:
                 return_value="User prompt text",
             ),
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ) as mock_llm,
@@ -143,15 +142,16 @@ class TestGenerateCompletion:
             )
 
             assert result == mock_llm_response
-            expected_system_prompt = (
-                "Previous conversation:\nQ: What is ML?\nA: ML is machine learning"
-                + "\nTASK:"
-                + "Custom system prompt"
-            )
+            expected_history = [
+                {
+                    "role": "user",
+                    "content": "Previous conversation:\nQ: What is ML?\nA: ML is machine learning",
+                }
+            ]
             mock_llm.assert_awaited_once_with(
                 text_input="User prompt text",
-                system_prompt=expected_system_prompt,
-                response_model=str,
+                system_prompt="Custom system prompt",
+                history=expected_history,
             )
 
     @pytest.mark.asyncio
@@ -207,7 +207,7 @@ class TestGenerateCompletion:
                 return_value="System prompt from file",
             ),
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ),
@@ -234,7 +234,7 @@ class TestSummarizeText:
         mock_llm_response = "Summary text"
 
         with patch(
-            "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+            "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
             new_callable=AsyncMock,
             return_value=mock_llm_response,
         ) as mock_llm:
@@ -250,7 +250,6 @@ class TestSummarizeText:
             mock_llm.assert_awaited_once_with(
                 text_input="Long text to summarize",
                 system_prompt="Custom summary prompt",
-                response_model=str,
             )
 
     @pytest.mark.asyncio
@@ -264,7 +263,7 @@ class TestSummarizeText:
                 return_value="System prompt from file",
             ),
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ) as mock_llm,
@@ -280,7 +279,6 @@ class TestSummarizeText:
             mock_llm.assert_awaited_once_with(
                 text_input="Long text to summarize",
                 system_prompt="System prompt from file",
-                response_model=str,
             )
 
     @pytest.mark.asyncio
@@ -294,7 +292,7 @@ class TestSummarizeText:
                 return_value="Default system prompt",
             ) as mock_read,
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ) as mock_llm,
@@ -308,7 +306,6 @@ class TestSummarizeText:
             mock_llm.assert_awaited_once_with(
                 text_input="Long text to summarize",
                 system_prompt="Default system prompt",
-                response_model=str,
             )
 
     @pytest.mark.asyncio
@@ -322,7 +319,7 @@ class TestSummarizeText:
                 return_value="Custom system prompt",
             ) as mock_read,
             patch(
-                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_structured_output",
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
                 new_callable=AsyncMock,
                 return_value=mock_llm_response,
             ) as mock_llm,
@@ -339,5 +336,61 @@ class TestSummarizeText:
             mock_llm.assert_awaited_once_with(
                 text_input="Long text to summarize",
                 system_prompt="Custom system prompt",
-                response_model=str,
             )
+
+
+class TestSummarizeTexts:
+    @pytest.mark.asyncio
+    async def test_summarize_texts_preserves_order(self):
+        """Test summarize_texts returns one summary per input text, in order."""
+        with (
+            patch(
+                "cognee.modules.retrieval.utils.completion.read_query_prompt",
+                return_value="System prompt from file",
+            ),
+            patch(
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
+                new_callable=AsyncMock,
+                side_effect=lambda text_input, **kwargs: f"summary of {text_input}",
+            ) as mock_llm,
+        ):
+            from cognee.modules.retrieval.utils.completion import summarize_texts
+
+            results = await summarize_texts(["first", "second", "third"])
+
+            assert results == ["summary of first", "summary of second", "summary of third"]
+            assert mock_llm.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_summarize_texts_respects_concurrency_limit(self):
+        """Test summarize_texts never exceeds the requested concurrency."""
+        import asyncio
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def tracked_call(text_input, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"summary of {text_input}"
+
+        with (
+            patch(
+                "cognee.modules.retrieval.utils.completion.read_query_prompt",
+                return_value="System prompt from file",
+            ),
+            patch(
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
+                new_callable=AsyncMock,
+                side_effect=tracked_call,
+            ),
+        ):
+            from cognee.modules.retrieval.utils.completion import summarize_texts
+
+            results = await summarize_texts([f"text {i}" for i in range(10)], concurrency=2)
+
+            assert len(results) == 10
+            assert max_in_flight <= 2
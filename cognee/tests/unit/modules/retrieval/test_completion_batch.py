@@ -0,0 +1,41 @@
+import json
+import pytest
+
+
+class TestSummarizeTextBatch:
+    def test_build_batch_jsonl_one_request_per_text(self):
+        """Test the JSONL payload has one chat-completion request per input text."""
+        from cognee.modules.retrieval.utils.completion_batch import _build_batch_jsonl
+
+        payload = _build_batch_jsonl(
+            ["first text", "second text"], "Summarize this.", "gpt-4o-mini", 1024
+        )
+        lines = [json.loads(line) for line in payload.decode("utf-8").splitlines()]
+
+        assert len(lines) == 2
+        assert lines[0]["custom_id"] == "0"
+        assert lines[1]["custom_id"] == "1"
+        for line, text in zip(lines, ["first text", "second text"]):
+            assert line["method"] == "POST"
+            assert line["url"] == "/v1/chat/completions"
+            assert line["body"]["model"] == "gpt-4o-mini"
+            assert line["body"]["max_completion_tokens"] == 1024
+            assert line["body"]["messages"] == [
+                {"role": "system", "content": "Summarize this."},
+                {"role": "user", "content": text},
+            ]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_provider_raises(self):
+        """Test summarize_text_batch rejects providers without batch support."""
+        from cognee.modules.retrieval.utils.completion_batch import summarize_text_batch
+
+        with pytest.raises(ValueError, match="Unsupported batch provider"):
+            await summarize_text_batch(["text"], provider="unsupported")
+
+    @pytest.mark.asyncio
+    async def test_empty_input_returns_empty_list(self):
+        """Test summarize_text_batch short-circuits on empty input without submitting a job."""
+        from cognee.modules.retrieval.utils.completion_batch import summarize_text_batch
+
+        assert await summarize_text_batch([]) == []
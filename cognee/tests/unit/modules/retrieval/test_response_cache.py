@@ -0,0 +1,164 @@
+import os
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from pydantic import BaseModel
+
+
+class FakeResponse(BaseModel):
+    answer: str
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    from cognee.modules.retrieval.utils import _response_cache
+
+    _response_cache._local_cache.clear()
+    yield
+    _response_cache._local_cache.clear()
+
+
+class TestCachedAcreateStructuredOutput:
+    @pytest.mark.asyncio
+    async def test_cache_disabled_passes_through(self):
+        """Test the gateway is called directly when COGNEE_LLM_CACHE is not set."""
+        with (
+            patch.dict(os.environ, {"COGNEE_LLM_CACHE": "false"}),
+            patch(
+                "cognee.modules.retrieval.utils._response_cache.LLMGateway.acreate_text_completion",
+                new_callable=AsyncMock,
+                return_value="answer",
+            ) as mock_llm,
+        ):
+            from cognee.modules.retrieval.utils._response_cache import (
+                cached_acreate_structured_output,
+            )
+
+            result = await cached_acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+            )
+
+            assert result == "answer"
+            mock_llm.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_served_from_cache(self):
+        """Test an identical request only hits the LLM once when caching is enabled."""
+        with (
+            patch.dict(os.environ, {"COGNEE_LLM_CACHE": "true"}),
+            patch(
+                "cognee.modules.retrieval.utils._response_cache.LLMGateway.acreate_text_completion",
+                new_callable=AsyncMock,
+                return_value="answer",
+            ) as mock_llm,
+        ):
+            from cognee.modules.retrieval.utils._response_cache import (
+                cached_acreate_structured_output,
+            )
+
+            first = await cached_acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+            )
+            second = await cached_acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+            )
+
+            assert first == "answer"
+            assert second == "answer"
+            mock_llm.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_get_different_cache_entries(self):
+        """Test requests with different prompts are not served the same cached response."""
+        with (
+            patch.dict(os.environ, {"COGNEE_LLM_CACHE": "true"}),
+            patch(
+                "cognee.modules.retrieval.utils._response_cache.LLMGateway.acreate_text_completion",
+                new_callable=AsyncMock,
+                side_effect=["answer one", "answer two"],
+            ) as mock_llm,
+        ):
+            from cognee.modules.retrieval.utils._response_cache import (
+                cached_acreate_structured_output,
+            )
+
+            first = await cached_acreate_structured_output(
+                text_input="question one",
+                system_prompt="system",
+                response_model=str,
+            )
+            second = await cached_acreate_structured_output(
+                text_input="question two",
+                system_prompt="system",
+                response_model=str,
+            )
+
+            assert first == "answer one"
+            assert second == "answer two"
+            assert mock_llm.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pydantic_response_round_trips_through_cache(self):
+        """Test a pydantic response is restored from its serialized cache entry."""
+        with (
+            patch.dict(os.environ, {"COGNEE_LLM_CACHE": "true"}),
+            patch(
+                "cognee.modules.retrieval.utils._response_cache.LLMGateway.acreate_structured_output",
+                new_callable=AsyncMock,
+                return_value=FakeResponse(answer="structured"),
+            ) as mock_llm,
+        ):
+            from cognee.modules.retrieval.utils._response_cache import (
+                cached_acreate_structured_output,
+            )
+
+            first = await cached_acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=FakeResponse,
+            )
+            second = await cached_acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=FakeResponse,
+            )
+
+            assert first == FakeResponse(answer="structured")
+            assert second == FakeResponse(answer="structured")
+            mock_llm.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nonzero_temperature_skips_cache(self):
+        """Test sampled requests bypass the cache entirely."""
+        with (
+            patch.dict(os.environ, {"COGNEE_LLM_CACHE": "true"}),
+            patch(
+                "cognee.modules.retrieval.utils._response_cache.LLMGateway.acreate_text_completion",
+                new_callable=AsyncMock,
+                return_value="answer",
+            ) as mock_llm,
+        ):
+            from cognee.modules.retrieval.utils._response_cache import (
+                cached_acreate_structured_output,
+            )
+
+            await cached_acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+                temperature=0.7,
+            )
+            await cached_acreate_structured_output(
+                text_input="question",
+                system_prompt="system",
+                response_model=str,
+                temperature=0.7,
+            )
+
+            assert mock_llm.await_count == 2
@@ -0,0 +1,134 @@
+import os
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def _mock_embedding_engine(vector):
+    engine = MagicMock()
+    engine.embed_text = AsyncMock(return_value=[vector])
+    return engine
+
+
+class TestSemanticCompletionCache:
+    @pytest.mark.asyncio
+    async def test_miss_on_empty_cache_returns_embedding(self):
+        """Test a lookup on an empty cache misses but still returns the embedding."""
+        from cognee.modules.retrieval.utils._semantic_cache import SemanticCompletionCache
+
+        cache = SemanticCompletionCache()
+
+        with patch(
+            "cognee.infrastructure.databases.vector.embeddings.get_embedding_engine",
+            return_value=_mock_embedding_engine([1.0, 0.0, 0.0]),
+        ):
+            response, embedding = await cache.get("What are TS prefs?", "system", str)
+
+        assert response is None
+        assert embedding is not None
+
+    @pytest.mark.asyncio
+    async def test_similar_prompt_hits_cache(self):
+        """Test a near-identical prompt embedding returns the cached response."""
+        from cognee.modules.retrieval.utils._semantic_cache import SemanticCompletionCache
+
+        cache = SemanticCompletionCache()
+
+        with patch(
+            "cognee.infrastructure.databases.vector.embeddings.get_embedding_engine",
+            return_value=_mock_embedding_engine([1.0, 0.0, 0.0]),
+        ):
+            _, embedding = await cache.get("What are TS prefs?", "system", str)
+            cache.add(embedding, "Uses strict TypeScript", "system", str)
+
+        with patch(
+            "cognee.infrastructure.databases.vector.embeddings.get_embedding_engine",
+            return_value=_mock_embedding_engine([0.999, 0.001, 0.0]),
+        ):
+            response, _ = await cache.get("List TypeScript preferences", "system", str)
+
+        assert response == "Uses strict TypeScript"
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_prompt_misses_cache(self):
+        """Test an unrelated prompt embedding does not return the cached response."""
+        from cognee.modules.retrieval.utils._semantic_cache import SemanticCompletionCache
+
+        cache = SemanticCompletionCache()
+
+        with patch(
+            "cognee.infrastructure.databases.vector.embeddings.get_embedding_engine",
+            return_value=_mock_embedding_engine([1.0, 0.0, 0.0]),
+        ):
+            _, embedding = await cache.get("What are TS prefs?", "system", str)
+            cache.add(embedding, "Uses strict TypeScript", "system", str)
+
+        with patch(
+            "cognee.infrastructure.databases.vector.embeddings.get_embedding_engine",
+            return_value=_mock_embedding_engine([0.0, 1.0, 0.0]),
+        ):
+            response, _ = await cache.get("What database is used?", "system", str)
+
+        assert response is None
+
+    @pytest.mark.asyncio
+    async def test_entries_are_isolated_per_system_prompt(self):
+        """Test responses cached under one system prompt are not reused for another."""
+        from cognee.modules.retrieval.utils._semantic_cache import SemanticCompletionCache
+
+        cache = SemanticCompletionCache()
+
+        with patch(
+            "cognee.infrastructure.databases.vector.embeddings.get_embedding_engine",
+            return_value=_mock_embedding_engine([1.0, 0.0, 0.0]),
+        ):
+            _, embedding = await cache.get("What are TS prefs?", "summarize", str)
+            cache.add(embedding, "Uses strict TypeScript", "summarize", str)
+
+            response, _ = await cache.get("What are TS prefs?", "classify", str)
+
+        assert response is None
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_degrades_to_cache_miss(self):
+        """Test an embedding-engine failure falls through to the LLM instead of raising."""
+        failing_engine = MagicMock()
+        failing_engine.embed_text = AsyncMock(side_effect=RuntimeError("embedding endpoint down"))
+
+        with (
+            patch.dict(os.environ, {"COGNEE_SEMANTIC_CACHE": "true"}),
+            patch(
+                "cognee.infrastructure.databases.vector.embeddings.get_embedding_engine",
+                return_value=failing_engine,
+            ),
+            patch(
+                "cognee.modules.retrieval.utils.completion.render_prompt",
+                return_value="user prompt",
+            ),
+            patch(
+                "cognee.modules.retrieval.utils.completion.read_query_prompt",
+                return_value="system prompt",
+            ),
+            patch(
+                "cognee.modules.retrieval.utils.completion.LLMGateway.acreate_text_completion",
+                new_callable=AsyncMock,
+                return_value="answer",
+            ) as mock_llm,
+        ):
+            from cognee.modules.retrieval.utils.completion import generate_completion
+
+            result = await generate_completion(
+                query="question",
+                context="context",
+                user_prompt_path="user_prompt.txt",
+                system_prompt_path="system_prompt.txt",
+            )
+
+        assert result == "answer"
+        mock_llm.assert_awaited_once()
+
+    def test_threshold_read_from_environment(self):
+        """Test the similarity threshold is configurable via environment variable."""
+        from cognee.modules.retrieval.utils._semantic_cache import get_similarity_threshold
+
+        with patch.dict(os.environ, {"COGNEE_SEMANTIC_CACHE_THRESHOLD": "0.8"}):
+            assert get_similarity_threshold() == 0.8
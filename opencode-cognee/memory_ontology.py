@@ -9,10 +9,24 @@ Usage:
         graph_model_file="/path/to/memory_ontology.py",
         graph_model_name="MemoryItem"
     )
+
+Note: list fields are kept in sorted order so that serialized memories are
+byte-identical regardless of extraction/retrieval order — stable content means
+stable prompt prefixes and cache keys downstream.
+
+Categorical fields are IntEnums rather than string Literals: each value is a
+small int (cheap to store and compare across thousands of memories) while JSON
+serialization still emits the human-readable names the LLM produces, and
+incoming string names are accepted transparently.
+
+For bulk in-memory materialization, the slot-backed *Record dataclasses below
+hold the same data without pydantic's per-instance __dict__ overhead.
 """
 
-from typing import Literal, Optional, List
-from pydantic import Field
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional, List
+from pydantic import Field, field_serializer, field_validator
 
 # Import Cognee's base class for graph entities
 try:
@@ -22,10 +36,73 @@ except ImportError:
     from pydantic import BaseModel as DataPoint
 
 
+class MemoryCategory(IntEnum):
+    """memU-style memory categories."""
+
+    preferences = 0
+    habits = 1
+    skills = 2
+    tools = 3
+    projects = 4
+    people = 5
+    decisions = 6
+    learnings = 7
+
+
+class MemoryConfidence(IntEnum):
+    """Extraction confidence levels."""
+
+    high = 0
+    medium = 1
+    low = 2
+
+
+class RelationshipType(IntEnum):
+    """Relationship kinds between memory items."""
+
+    uses = 0            # tool/project usage
+    prefers = 1         # preference relationship
+    knows = 2           # skill/knowledge
+    works_with = 3      # collaboration
+    decided = 4         # decision made
+    learned_from = 5    # learning source
+    part_of = 6         # hierarchical
+    conflicts_with = 7  # incompatibility
+    enhances = 8        # complementary
+
+
+class RelationshipStrength(IntEnum):
+    """Relationship strength levels."""
+
+    strong = 0
+    moderate = 1
+    weak = 2
+
+
+class MemoryImportance(IntEnum):
+    """Importance levels for future sessions."""
+
+    critical = 0
+    important = 1
+    minor = 2
+
+
+def _from_name(enum_cls, value):
+    """Accept enum member names (what the LLM emits) as well as raw values."""
+    if isinstance(value, str):
+        try:
+            return enum_cls[value]
+        except KeyError:
+            # Raise ValueError so pydantic reports it as a ValidationError,
+            # just like the Literal fields these enums replaced.
+            raise ValueError(f'invalid {enum_cls.__name__}: {value!r}')
+    return value
+
+
 class MemoryItem(DataPoint):
     """
     A structured memory item with category classification.
-    
+
     Categories (inspired by memU):
     - preferences: User likes, dislikes, choices (e.g., "prefers TypeScript")
     - habits: Recurring behaviors, patterns, workflows
@@ -36,69 +113,119 @@ class MemoryItem(DataPoint):
     - decisions: Architectural choices, trade-offs made
     - learnings: Lessons learned, insights, discoveries
     """
-    
-    category: Literal[
-        'preferences',
-        'habits', 
-        'skills',
-        'tools',
-        'projects',
-        'people',
-        'decisions',
-        'learnings'
-    ] = Field(
+
+    category: MemoryCategory = Field(
         description="The type of memory being stored"
     )
-    
+
     name: str = Field(
         description="Short identifier for this memory (e.g., 'TypeScript preference')"
     )
-    
+
     description: str = Field(
         description="Detailed description of the memory content"
     )
-    
-    confidence: Literal['high', 'medium', 'low'] = Field(
-        default='medium',
+
+    confidence: MemoryConfidence = Field(
+        default=MemoryConfidence.medium,
         description="How confident the extraction is"
     )
-    
+
     source_context: Optional[str] = Field(
         default=None,
         description="Original context where this was mentioned"
     )
-    
+
     related_entities: Optional[List[str]] = Field(
         default_factory=list,
         description="Other entities this memory relates to"
     )
 
+    @field_validator('category', mode='before')
+    @classmethod
+    def coerce_category(cls, value):
+        return _from_name(MemoryCategory, value)
+
+    @field_validator('confidence', mode='before')
+    @classmethod
+    def coerce_confidence(cls, value):
+        return _from_name(MemoryConfidence, value)
+
+    @field_serializer('category', 'confidence')
+    def serialize_enum_names(self, value):
+        """Serialize enum fields as their string names, matching the old Literals."""
+        return value.name
+
+    @field_validator('related_entities')
+    @classmethod
+    def sort_related_entities(cls, value):
+        """Keep related entities in canonical sorted order for stable serialization."""
+        return sorted(value) if value else value
+
+
+@dataclass
+class MemoryItemRecord:
+    """
+    Slot-backed compact counterpart of MemoryItem.
+
+    Pydantic v2 models always carry a per-instance __dict__ (~300+ B each),
+    which adds up when millions of extracted memories are held in memory at
+    once. Validate with MemoryItem at the extraction boundary, then convert
+    with from_model for bulk storage: __slots__ drops the instance __dict__
+    and makes attribute access a fixed slot lookup.
+    """
+
+    __slots__ = ('category', 'name', 'description', 'confidence', 'source_context', 'related_entities')
+
+    category: MemoryCategory
+    name: str
+    description: str
+    confidence: MemoryConfidence
+    source_context: Optional[str]
+    related_entities: List[str]
+
+    @classmethod
+    def from_model(cls, item: 'MemoryItem') -> 'MemoryItemRecord':
+        return cls(
+            category=item.category,
+            name=item.name,
+            description=item.description,
+            confidence=item.confidence,
+            source_context=item.source_context,
+            related_entities=item.related_entities,
+        )
+
 
 class MemoryRelationship(DataPoint):
     """
     Relationships between memory items.
     """
-    
+
     source: str = Field(description="Source memory item name")
     target: str = Field(description="Target memory item name")
-    
-    relationship_type: Literal[
-        'uses',           # tool/project usage
-        'prefers',        # preference relationship
-        'knows',          # skill/knowledge
-        'works_with',     # collaboration
-        'decided',        # decision made
-        'learned_from',   # learning source
-        'part_of',        # hierarchical
-        'conflicts_with', # incompatibility
-        'enhances'        # complementary
-    ] = Field(description="Type of relationship")
-    
-    strength: Literal['strong', 'moderate', 'weak'] = Field(
-        default='moderate',
+
+    relationship_type: RelationshipType = Field(description="Type of relationship")
+
+    strength: RelationshipStrength = Field(
+        default=RelationshipStrength.moderate,
         description="Strength of the relationship"
     )
 
+    @field_validator('relationship_type', mode='before')
+    @classmethod
+    def coerce_relationship_type(cls, value):
+        return _from_name(RelationshipType, value)
+
+    @field_validator('strength', mode='before')
+    @classmethod
+    def coerce_strength(cls, value):
+        return _from_name(RelationshipStrength, value)
+
+    @field_serializer('relationship_type', 'strength')
+    def serialize_enum_names(self, value):
+        """Serialize enum fields as their string names, matching the old Literals."""
+        return value.name
+
 
 # For simpler extraction, a combined model
 class CategorizedMemory(DataPoint):
@@ -106,23 +233,48 @@ class CategorizedMemory(DataPoint):
     Simplified model for quick memory categorization.
     Use this for session summaries and quick memories.
     """
-    
-    category: Literal[
-        'preferences',
-        'habits',
-        'skills', 
-        'tools',
-        'projects',
-        'people',
-        'decisions',
-        'learnings'
-    ]
-    
+
+    category: MemoryCategory
+
     content: str = Field(
         description="The memory content in natural language"
     )
-    
-    importance: Literal['critical', 'important', 'minor'] = Field(
-        default='important',
+
+    importance: MemoryImportance = Field(
+        default=MemoryImportance.important,
         description="How important this memory is for future sessions"
     )
+
+    @field_validator('category', mode='before')
+    @classmethod
+    def coerce_category(cls, value):
+        return _from_name(MemoryCategory, value)
+
+    @field_validator('importance', mode='before')
+    @classmethod
+    def coerce_importance(cls, value):
+        return _from_name(MemoryImportance, value)
+
+    @field_serializer('category', 'importance')
+    def serialize_enum_names(self, value):
+        """Serialize enum fields as their string names, matching the old Literals."""
+        return value.name
+
+
+@dataclass
+class CategorizedMemoryRecord:
+    """Slot-backed compact counterpart of CategorizedMemory (see MemoryItemRecord)."""
+
+    __slots__ = ('category', 'content', 'importance')
+
+    category: MemoryCategory
+    content: str
+    importance: MemoryImportance
+
+    @classmethod
+    def from_model(cls, memory: 'CategorizedMemory') -> 'CategorizedMemoryRecord':
+        return cls(
+            category=memory.category,
+            content=memory.content,
+            importance=memory.importance,
+        )